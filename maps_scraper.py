@@ -1,14 +1,25 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from selectolax.parser import HTMLParser
+import httpx
+import orjson
+import asyncio
 import time
+from contextlib import asynccontextmanager
 import csv
 import os
 import argparse
 import re
-import json
+import random
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Set
-from urllib.parse import urlparse
+from typing import Optional, List, Dict, Set, Iterator, Tuple, Union, Sequence
+from urllib.parse import urljoin
+
+# Optional DFA scanner for email extraction (falls back to `re`)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # ============================================
 # CONFIGURATION & CONSTANTS
@@ -17,6 +28,9 @@ LOG_DIR = "logs"
 CHECKPOINT_DIR = "checkpoints"
 OUTPUT_DIR = "output"
 
+BROWSER_PROFILE_DIR = os.path.join(CHECKPOINT_DIR, "_cdp_profile")
+BROWSER_DISK_CACHE_SIZE = 256 * 1024 * 1024  # bytes
+
 os.makedirs(LOG_DIR, exist_ok=True)
 os.makedirs(CHECKPOINT_DIR, exist_ok=True)
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -42,23 +56,239 @@ if sys.platform == 'win32':
     except:
         pass
 
-# CSS Selectors (with fallbacks)
-SEARCH_BOX_SELECTORS = [
+# CSS Selectors (fallbacks in priority order, each resolved in one query)
+SEARCH_BOX_SELECTORS = (
     "input#searchboxinput",
     "input[aria-label*='Search']",
     "input[name='q']",
     "input.searchboxinput",
-]
-RESULTS_PANEL_SELECTORS = [
+)
+RESULTS_PANEL_SELECTORS = (
     'div[role="feed"]',
     'div.m6QErb[aria-label]',
-]
-BUSINESS_NAME_SELECTORS = [
+)
+BUSINESS_NAME_SELECTORS = (
     'h1.DUwDvf',
     'h1.fontHeadlineLarge',
     'h1',
-]
+)
 BUSINESS_CARD_SELECTOR = 'a.hfpxzc'
+CONTACT_LINK_SELECTOR = 'a[href*="contact"], a[href*="about"]'
+INVALID_BUSINESS_NAMES = {"results", "overview", "about", "reviews", "n/a"}
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Browser-side lookup of the first visible element, trying selectors in priority order
+FIRST_VISIBLE_JS = r"""
+(selectors) => {
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (el.getClientRects().length && getComputedStyle(el).visibility !== 'hidden') return el;
+        }
+    }
+    return null;
+}
+"""
+
+# Browser-side scroll loop for the results panel (one CDP round-trip)
+SCROLL_RESULTS_JS = r"""
+async ({panel, deadlineMs, delayMs, maxScrolls}) => {
+    const deadline = Date.now() + deadlineMs;
+    const reachedEnd = () => {
+        if (panel.querySelector('span.HlvSq')) return true;
+        const last = panel.lastElementChild;
+        return !!last && (last.textContent || '').includes("You've reached the end");
+    };
+    // Resolve as soon as new cards are added, or after delayMs
+    const waitForCards = (ms) => new Promise((resolve) => {
+        const observer = new MutationObserver((records) => {
+            if (!records.some((r) => r.addedNodes.length)) return;
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            resolve(false);
+        }, ms);
+        observer.observe(panel, {childList: true, subtree: true});
+    });
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+    const result = {scrolls: 0, stable: false, reachedEnd: false, timedOut: false, exhausted: false};
+    let prevHeight = -1;
+    let unchanged = 0;
+    for (let i = 0; i < maxScrolls; i++) {
+        if (Date.now() > deadline) { result.timedOut = true; break; }
+        const stepStart = Date.now();
+        panel.scrollTo(0, panel.scrollHeight);
+        await waitForCards(delayMs);
+        let height = panel.scrollHeight;
+        if (height === prevHeight) {
+            // Woken without growth (spinner, card hydration): sit out the full step
+            const rest = delayMs - (Date.now() - stepStart);
+            if (rest > 0) await sleep(rest);
+            height = panel.scrollHeight;
+        }
+        if (height !== prevHeight) {
+            unchanged = 0;
+            result.scrolls++;
+        } else if (++unchanged >= 3) {
+            result.stable = true;
+            break;
+        }
+        prevHeight = height;
+        if (reachedEnd()) { result.reachedEnd = true; break; }
+    }
+    result.exhausted = !(result.stable || result.reachedEnd || result.timedOut);
+    return result;
+}
+"""
+
+# Browser-side extraction of every loaded result card (one CDP round-trip)
+EXTRACT_CARDS_JS = r"""
+(cardSelector) => {
+    const phoneRe = /^\+?[\d\s\-\(\)]{7,}$/;
+    const records = [];
+    const seen = new Set();
+
+    document.querySelectorAll(cardSelector).forEach((link) => {
+        const href = link.getAttribute('href');
+        if (!href || seen.has(href)) return;
+        seen.add(href);
+
+        const card = link.closest('div.Nv2PK') || link.closest('[role="article"]') || link.parentElement;
+        const record = {href, name: 'N/A', address: 'N/A', phone: 'N/A', website: 'N/A'};
+
+        const nameEl = card.querySelector('.qBF1Pd, .fontHeadlineSmall');
+        record.name = ((nameEl && nameEl.innerText) || link.getAttribute('aria-label') || 'N/A').trim();
+
+        const websiteEl = card.querySelector('a[data-value="Website"], a[aria-label*="Website"]');
+        const websiteHref = websiteEl && websiteEl.getAttribute('href');
+        if (websiteHref && websiteHref.startsWith('http')) record.website = websiteHref;
+
+        // Info rows look like "Category · 12 Main St" / "Open · +1 555 0100"
+        card.querySelectorAll('.W4Efsd').forEach((row) => {
+            if (row.querySelector('.W4Efsd')) return;
+            (row.innerText || '').split('·').map((s) => s.trim()).filter(Boolean).forEach((part) => {
+                if (phoneRe.test(part)) {
+                    if (record.phone === 'N/A') record.phone = part;
+                } else if (record.address === 'N/A' && /\d/.test(part) && /[a-zA-Z]/.test(part)
+                           && !/^(open|closed|opens|closes)\b/i.test(part) && !/^\d[\d.,]*\s*\(/.test(part)) {
+                    record.address = part;
+                }
+            });
+        });
+
+        records.push(record);
+    });
+
+    return records;
+}
+"""
+
+# Browser-side extraction of the business detail view (one CDP round-trip)
+EXTRACT_BUSINESS_JS = r"""
+(nameSelectors) => {
+    const out = {name: 'N/A', address: 'N/A', phone: 'N/A', website: 'N/A'};
+    const phoneRe = /[\d\s\-\(\)\+]+/;
+    const phoneLongRe = /[\d\s\-\(\)\+]{10,}/;
+    const urlRe = /https?:\/\/[^\s]+/;
+    const afterColon = (s) => s.slice(s.indexOf(':') + 1).trim();
+
+    nameLookup:
+    for (const selector of nameSelectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (el.getClientRects().length) {
+                out.name = (el.innerText || '').trim();
+                break nameLookup;
+            }
+        }
+    }
+
+    // Contact info from buttons
+    document.querySelectorAll('button[data-item-id]').forEach((btn) => {
+        const aria = btn.getAttribute('aria-label');
+        if (!aria) return;
+        const ariaLower = aria.toLowerCase();
+        if (ariaLower.includes('address:') || ariaLower.includes('located at')) {
+            out.address = afterColon(aria);
+        } else if (ariaLower.includes('phone:') || ariaLower.includes('call')) {
+            const m = aria.match(phoneRe);
+            if (m) out.phone = m[0].trim();
+        } else if (ariaLower.includes('website:') || aria.startsWith('http')) {
+            const m = aria.match(urlRe);
+            if (m) out.website = m[0].trim();
+            else if (aria.includes(':')) out.website = afterColon(aria);
+        }
+    });
+
+    // Alternative selectors for missing fields
+    if (out.phone === 'N/A') {
+        for (const selector of ['button[data-item-id*="phone"]', 'button[aria-label*="Phone"]', 'div[data-tooltip*="phone" i]']) {
+            const el = document.querySelector(selector);
+            if (!el) continue;
+            const m = (el.getAttribute('aria-label') || el.innerText || '').match(phoneLongRe);
+            if (m) { out.phone = m[0].trim(); break; }
+        }
+    }
+    if (out.website === 'N/A') {
+        for (const selector of ['a[data-item-id*="authority"]', 'button[data-item-id*="authority"]', 'a[aria-label*="Website"]']) {
+            const el = document.querySelector(selector);
+            if (!el) continue;
+            const href = el.getAttribute('href');
+            const aria = el.getAttribute('aria-label');
+            if (href && href.startsWith('http')) { out.website = href; break; }
+            const m = aria && aria.match(urlRe);
+            if (m) { out.website = m[0]; break; }
+        }
+    }
+    if (out.address === 'N/A') {
+        for (const selector of ['button[data-item-id*="address"]', 'button[aria-label*="Address"]']) {
+            const el = document.querySelector(selector);
+            if (!el) continue;
+            const aria = el.getAttribute('aria-label');
+            if (aria && aria.toLowerCase().includes('address:')) { out.address = afterColon(aria); break; }
+        }
+    }
+
+    return out;
+}
+"""
+
+# Precompiled regex patterns
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9._%+-]*@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_EMAIL_FINDALL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_EMAIL_FINDALL_BYTES = re.compile(_EMAIL_FINDALL.pattern.encode())
+_PHONE_NORMALIZE = re.compile(r'[^\d+]')
+_SAFE_FN = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Hyperscan databases (None when hyperscan is unavailable)
+_EMAIL_SCAN_DB = None
+_EMAIL_VALIDATE_DB = None
+if hyperscan is not None:
+    try:
+        _EMAIL_SCAN_DB = hyperscan.Database()
+        _EMAIL_SCAN_DB.compile(
+            expressions=[_EMAIL_FINDALL.pattern.encode()],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST]
+        )
+        _EMAIL_VALIDATE_DB = hyperscan.Database()
+        _EMAIL_VALIDATE_DB.compile(
+            expressions=[_EMAIL_PATTERN.pattern.encode()],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH]
+        )
+    except Exception as e:
+        logger.warning(f"Hyperscan unavailable, falling back to re: {e}")
+        _EMAIL_SCAN_DB = None
+        _EMAIL_VALIDATE_DB = None
+
+# Resource types failed over CDP Fetch (images are off via --blink-settings).
+# Playwright routing is avoided on purpose: it disables the HTTP cache the
+# persistent profile keeps warm.
+BLOCKED_RESOURCE_TYPES = ("Font", "Media")
 
 # Timeouts (in milliseconds)
 SEARCH_TIMEOUT = 60000
@@ -67,18 +297,33 @@ WEBSITE_LOAD_TIMEOUT = 15000
 ELEMENT_WAIT_TIMEOUT = 5000
 
 # Email settings
+JS_SHELL_MAX_BYTES = 1024  # smaller HTML with <script> needs a real browser
+MAX_EMAILS_PER_PAGE = 32  # stop scanning a page once this many are found
+STREAM_CHUNK_SIZE = 65536  # bytes read per chunk when streaming pages
+STREAM_OVERLAP_BYTES = 256  # carried across chunks to catch split emails
 SKIP_EMAIL_DOMAINS = {
     'facebook.com', 'instagram.com', 'twitter.com', 'youtube.com',
     'tiktok.com', 'linkedin.com', 'pinterest.com', 'google.com',
     'maps.google.com', 'yelp.com', 'tripadvisor.com'
 }
+_INVALID_PREFIXES = ('test@', 'example@', 'temp@', 'placeholder@', 'noreply@', 'no-reply@')
+_INVALID_EXTS = ('.png', '.jpg', '.gif', '.svg', '.webp')
+_SKIP_SUFFIXES = tuple('.' + d for d in SKIP_EMAIL_DOMAINS) + tuple(SKIP_EMAIL_DOMAINS)
+
+# Output columns (CSV header order)
+OUTPUT_FIELDS = ("name", "address", "phone", "website", "emails")
 
 # Rate limiting
 DELAY_BETWEEN_REQUESTS = 2  # seconds
-DELAY_BETWEEN_BUSINESS = 2.5  # seconds
-DELAY_BETWEEN_SCROLL = 2  # seconds
+MAX_BUSINESS_QPS = 0.5  # detail page loads per second, shared by all workers
+RATE_LIMIT_JITTER = 0.2  # max extra random delay (seconds)
+DELAY_BETWEEN_SCROLL = 0.8  # seconds (cut short when new cards appear)
+MAX_SCROLLS = 200
 DELAY_AFTER_EMAIL_EXTRACTION = 2  # seconds
 
+# Concurrency
+MAX_CONCURRENCY = 4  # businesses processed in parallel
+
 # Retry settings
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
@@ -89,352 +334,513 @@ RETRY_DELAY = 2  # seconds
 
 def safe_filename(text: str) -> str:
     """Convert text to safe filename by replacing special chars"""
-    return re.sub(r'[^a-zA-Z0-9_-]', '_', text)[:100]
+    return _SAFE_FN.sub('_', text)[:100]
 
 def normalize_phone(phone: str) -> str:
     """Normalize phone number by removing special characters"""
     if phone == "N/A":
         return phone
-    return re.sub(r'[^\d+]', '', phone)
+    return _PHONE_NORMALIZE.sub('', phone)
 
 def validate_email(email: str) -> bool:
     """Validate email format more strictly"""
-    pattern = r'^[a-zA-Z0-9][a-zA-Z0-9._%+-]*@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if _EMAIL_VALIDATE_DB is not None:
+        matched = []
+        _EMAIL_VALIDATE_DB.scan(
+            email.encode('utf-8'),
+            match_event_handler=lambda *_: matched.append(True)
+        )
+        if not matched:
+            return False
+    elif not _EMAIL_PATTERN.match(email):
         return False
     
     # Exclude common false positives
-    invalid_patterns = ['test@', 'example@', 'temp@', 'placeholder@', 'noreply@', 'no-reply@']
-    invalid_extensions = ['.png', '.jpg', '.gif', '.svg', '.webp']
-    
     email_lower = email.lower()
-    if any(email_lower.startswith(p) for p in invalid_patterns):
+    if email_lower.startswith(_INVALID_PREFIXES):
         return False
-    if any(email_lower.endswith(ext) for ext in invalid_extensions):
+    if email_lower.endswith(_INVALID_EXTS):
         return False
     
     return True
 
-def extract_emails_from_text(text: str) -> Set[str]:
-    """Extract and validate emails from text"""
-    pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    found = re.findall(pattern, text)
-    return {e for e in found if validate_email(e)}
+def _iter_email_spans(buf: bytes) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) offsets of email-like runs in a byte buffer"""
+    if _EMAIL_SCAN_DB is None:
+        for match in _EMAIL_FINDALL_BYTES.finditer(buf):
+            yield match.span()
+        return
+    
+    # Hyperscan reports every match end; keep the longest span per start
+    spans = {}
+    
+    def on_match(_id, start, end, _flags, _context):
+        if end > spans.get(start, -1):
+            spans[start] = end
+    
+    _EMAIL_SCAN_DB.scan(buf, match_event_handler=on_match)
+    
+    # Drop overlapping spans to mirror re.finditer semantics
+    last_end = -1
+    for start in sorted(spans):
+        if start < last_end:
+            continue
+        last_end = spans[start]
+        yield start, last_end
+
+def extract_emails_from_text(text: Union[str, bytes], limit: int = MAX_EMAILS_PER_PAGE) -> Set[str]:
+    """Extract and validate emails from text or raw HTML bytes"""
+    buf = text.encode('utf-8', 'ignore') if isinstance(text, str) else text
+    emails = set()
+    for start, end in _iter_email_spans(buf):
+        email = buf[start:end].decode('ascii', 'ignore')
+        if validate_email(email):
+            emails.add(email)
+            if len(emails) >= limit:
+                break
+    return emails
+
+async def extract_emails_from_stream(response, limit: int = MAX_EMAILS_PER_PAGE) -> Set[str]:
+    """Extract emails from a streamed httpx response without buffering the whole body"""
+    emails = set()
+    tail = b''
+    window = b''
+    
+    def scan(buf: bytes, final: bool):
+        for start, end in _iter_email_spans(buf):
+            # Matches near the chunk edges may be cut off; the overlap rescans them
+            if start == 0 and tail:
+                continue
+            if not final and end > len(buf) - STREAM_OVERLAP_BYTES // 2:
+                continue
+            email = buf[start:end].decode('ascii', 'ignore')
+            if validate_email(email):
+                emails.add(email)
+                if len(emails) >= limit:
+                    return
+    
+    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+        if window:
+            scan(window, final=False)
+            if len(emails) >= limit:
+                return emails
+            tail = window[-STREAM_OVERLAP_BYTES:]
+        window = tail + chunk
+    
+    if window:
+        scan(window, final=True)
+    return emails
 
 def should_skip_email_extraction(website: str) -> bool:
     """Check if website is in skip list"""
     try:
-        domain = urlparse(website).netloc.lower()
-        domain = domain.replace('www.', '')
-        return any(skip in domain for skip in SKIP_EMAIL_DOMAINS)
+        # Slice the host out by hand; urlparse is overkill for a suffix check
+        start = website.find("://")
+        start = start + 3 if start != -1 else 0
+        # Host ends at the first path, query or fragment delimiter
+        end = len(website)
+        for delimiter in "/?#":
+            pos = website.find(delimiter, start)
+            if pos != -1 and pos < end:
+                end = pos
+        host = website[start:end]
+        host = host.split("@")[-1].split(":")[0].lower()
+        if host.startswith("www."):
+            host = host[4:]
+        return host.endswith(_SKIP_SUFFIXES)
     except:
         return True
 
-def wait_for_selector(page, selectors: List[str], timeout: int = ELEMENT_WAIT_TIMEOUT) -> bool:
-    """Try multiple selectors with fallback"""
-    for i, selector in enumerate(selectors):
-        try:
-            logger.debug(f"Trying selector {i+1}/{len(selectors)}: {selector}")
-            page.wait_for_selector(selector, timeout=timeout, state='visible')
-            logger.debug(f"Success with selector: {selector}")
-            return True
-        except Exception as e:
-            logger.debug(f"Selector failed: {selector} - {str(e)[:50]}")
-            continue
-    logger.debug(f"All {len(selectors)} selectors failed")
-    return False
+async def block_heavy_resources(page):
+    """Fail font and media requests for a page via CDP Fetch (keeps the HTTP cache on)"""
+    try:
+        session = await page.context.new_cdp_session(page)
+        
+        async def on_request_paused(event):
+            try:
+                await session.send("Fetch.failRequest", {
+                    "requestId": event["requestId"],
+                    "errorReason": "BlockedByClient"
+                })
+            except Exception as e:
+                logger.debug("Could not block request: %s", e)
+        
+        session.on("Fetch.requestPaused", on_request_paused)
+        await session.send("Fetch.enable", {
+            "patterns": [{"resourceType": t} for t in BLOCKED_RESOURCE_TYPES]
+        })
+    except Exception as e:
+        logger.debug("Could not enable resource blocking: %s", e)
 
-def get_selector(page, selectors: List[str]):
-    """Get element using fallback selectors"""
-    for selector in selectors:
-        try:
-            element = page.query_selector(selector)
-            if element and element.is_visible():
-                return element
-        except:
-            continue
-    return None
+async def wait_for_selector(page, selectors: Sequence[str], timeout: int = ELEMENT_WAIT_TIMEOUT) -> bool:
+    """Wait until any of the fallback selectors has a visible match"""
+    # :visible on each alternative so a hidden earlier match doesn't block the wait
+    selector = ", ".join(f"{s}:visible" for s in selectors)
+    try:
+        await page.wait_for_selector(selector, timeout=timeout, state='visible')
+        logger.debug("Success with selector: %s", selector)
+        return True
+    except Exception as e:
+        logger.debug("Selector failed: %s - %.50s", selector, e)
+        return False
+
+async def get_selector(page, selectors: Sequence[str]):
+    """Get the first visible element, trying fallback selectors in priority order"""
+    try:
+        handle = await page.evaluate_handle(FIRST_VISIBLE_JS, list(selectors))
+        return handle.as_element()
+    except:
+        return None
 
-def retry_action(action, max_retries: int = MAX_RETRIES, delay: float = RETRY_DELAY):
-    """Retry an action with exponential backoff"""
+async def retry_action(action, max_retries: int = MAX_RETRIES, delay: float = RETRY_DELAY):
+    """Retry an async action with exponential backoff"""
     for attempt in range(max_retries):
         try:
-            return action()
+            return await action()
         except Exception as e:
             if attempt == max_retries - 1:
                 raise
             logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay}s...")
-            time.sleep(delay)
+            await asyncio.sleep(delay)
             delay *= 1.5
     return None
 
-def save_checkpoint(checkpoint_file: str, businesses: List[Dict], index: int):
-    """Save progress checkpoint"""
-    checkpoint = {
-        "timestamp": datetime.now().isoformat(),
-        "index": index,
-        "businesses_count": len(businesses),
-        "businesses": businesses
-    }
-    with open(checkpoint_file, "w", encoding="utf-8") as f:
-        json.dump(checkpoint, f, indent=2, ensure_ascii=False)
-    logger.info(f"Checkpoint saved: {index} businesses processed")
+def format_emails(emails: Set[str]) -> str:
+    """Render an email set as the comma-separated output field"""
+    return ", ".join(sorted(emails)) or "N/A"
+
+def parse_emails(emails) -> Set[str]:
+    """Rebuild an email set from a checkpoint value (list or legacy string)"""
+    if isinstance(emails, str):
+        return set() if emails == "N/A" else set(emails.split(", "))
+    return set(emails or ())
+
+def _json_default(obj):
+    """Serialize email sets as sorted lists"""
+    if isinstance(obj, set):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def append_checkpoint(checkpoint_file: str, business: Dict, index: int):
+    """Append one processed business to the JSONL progress checkpoint"""
+    with open(checkpoint_file, "ab") as f:
+        f.write(orjson.dumps({"i": index, "b": business}, default=_json_default))
+        f.write(b"\n")
+    logger.debug("Checkpoint appended: business %d", index + 1)
 
 def load_checkpoint(checkpoint_file: str) -> Optional[Dict]:
     """Load progress checkpoint"""
     if os.path.exists(checkpoint_file):
         try:
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                checkpoint = json.load(f)
-            logger.info(f"Checkpoint loaded: {checkpoint['index']} businesses already processed")
+            with open(checkpoint_file, "r+b") as f:
+                data = f.read()
+                # A crash mid-write can leave a partial last line; cut it off
+                # so the next append starts on a fresh line
+                complete = data.rfind(b"\n") + 1
+                if complete < len(data):
+                    logger.warning("Checkpoint ended with a partial entry, discarding it")
+                    f.truncate(complete)
+            
+            businesses = []
+            done = set()
+            for line in data[:complete].splitlines():
+                try:
+                    entry = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                business = entry["b"]
+                business["emails"] = parse_emails(business.get("emails"))
+                businesses.append(business)
+                done.add(entry["i"])
+            checkpoint = {
+                "done": done,
+                "businesses": businesses
+            }
+            logger.info(f"Checkpoint loaded: {len(done)} businesses already processed")
             return checkpoint
         except Exception as e:
             logger.warning(f"Could not load checkpoint: {e}")
     return None
 
+def business_key(business: Dict) -> Tuple[str, str]:
+    """Composite dedup key: normalized name + normalized phone (or address)"""
+    name_key = business["name"].lower().strip()
+    
+    # If phone is N/A, use address for deduplication
+    if business["phone"] == "N/A":
+        return (name_key, business["address"].lower().strip())
+    return (name_key, normalize_phone(business["phone"]))
+
 def deduplicate_businesses(businesses: List[Dict]) -> List[Dict]:
     """Deduplicate businesses with better matching"""
     seen = {}
     for business in businesses:
-        # Create composite key: normalized name + normalized phone
-        name_key = business["name"].lower().strip()
-        phone_key = normalize_phone(business["phone"])
-        
-        # If phone is N/A, use address for deduplication
-        if phone_key == "N/A":
-            address_key = business["address"].lower().strip()
-            key = (name_key, address_key)
-        else:
-            key = (name_key, phone_key)
+        key = business_key(business)
         
         # If key exists, merge emails
         if key in seen:
             existing = seen[key]
-            if business["emails"] != "N/A":
-                existing_emails = set(existing["emails"].split(", ")) if existing["emails"] != "N/A" else set()
-                new_emails = set(business["emails"].split(", "))
-                merged_emails = existing_emails | new_emails
-                existing["emails"] = ", ".join(sorted(merged_emails)) if merged_emails else "N/A"
+            existing["emails"] |= business["emails"]
         else:
             seen[key] = business
     
     return list(seen.values())
 
-def scroll_results_panel(page, results_panel, timeout: int, start_time: float) -> int:
+async def scroll_results_panel(page, results_panel, timeout: int, start_time: float) -> int:
     """Scroll the results panel to load all businesses"""
     if not results_panel:
         logger.warning("Results panel is None, skipping scroll")
         return 0
     
-    prev_height = 0
-    scroll_count = 0
-    no_change_count = 0
+    remaining = timeout - (time.time() - start_time)
+    if remaining <= 0:
+        logger.warning(f"Global timeout reached ({timeout}s)")
+        return 0
     
-    for scroll_attempt in range(100):
-        if time.time() - start_time > timeout:
-            logger.warning(f"Global timeout reached ({timeout}s)")
-            break
-        
-        try:
-            # Scroll the results panel
-            page.evaluate(
-                "(panel) => panel.scrollTo(0, panel.scrollHeight)",
-                results_panel
-            )
-            time.sleep(DELAY_BETWEEN_SCROLL)
-            
-            # Get current height
-            curr_height = page.evaluate(
-                "(panel) => panel.scrollHeight",
-                results_panel
-            )
-            
-            # Check if we've reached the end
-            if curr_height == prev_height:
-                no_change_count += 1
-                if no_change_count >= 3:
-                    logger.info("[OK] No more new results (confirmed after 3 checks)")
-                    break
-            else:
-                no_change_count = 0
-                scroll_count += 1
-            
-            prev_height = curr_height
-            
-            # Check for "You've reached the end" message
-            try:
-                end_text = page.query_selector('span:has-text("You\'ve reached the end")')
-                if end_text:
-                    logger.info("[OK] Reached end of list")
-                    break
-            except:
-                pass
-                
-        except Exception as e:
-            logger.debug(f"Scroll error: {e}")
-            break
+    try:
+        result = await page.evaluate(SCROLL_RESULTS_JS, {
+            "panel": results_panel,
+            "deadlineMs": int(remaining * 1000),
+            "delayMs": int(DELAY_BETWEEN_SCROLL * 1000),
+            "maxScrolls": MAX_SCROLLS
+        })
+    except Exception as e:
+        logger.debug("Scroll error: %s", e)
+        return 0
+    
+    if result["timedOut"]:
+        logger.warning(f"Global timeout reached ({timeout}s)")
+    elif result["reachedEnd"]:
+        logger.info("[OK] Reached end of list")
+    elif result["stable"]:
+        logger.info("[OK] No more new results (confirmed after 3 checks)")
+    elif result["exhausted"]:
+        logger.warning(f"Stopped after {MAX_SCROLLS} scrolls; the list may not be fully loaded")
     
-    return scroll_count
+    return result["scrolls"]
 
-def extract_business_data(page) -> Dict:
-    """Extract business data from the current detail view"""
+async def extract_business_data(page) -> Dict:
+    """Extract business data from the current detail view in one round-trip"""
+    try:
+        data = await page.evaluate(EXTRACT_BUSINESS_JS, list(BUSINESS_NAME_SELECTORS))
+    except Exception as e:
+        logger.debug("Error extracting business data: %s", e)
+        return None
+    
     business = {
-        "name": "N/A",
-        "address": "N/A",
-        "phone": "N/A",
-        "website": "N/A",
-        "emails": "N/A"
+        "name": data.get("name") or "N/A",
+        "address": data.get("address") or "N/A",
+        "phone": data.get("phone") or "N/A",
+        "website": data.get("website") or "N/A",
+        "emails": set()
     }
     
-    # Extract business name
-    name_el = get_selector(page, BUSINESS_NAME_SELECTORS)
-    if name_el:
-        try:
-            business["name"] = name_el.inner_text().strip()
-        except Exception as e:
-            logger.debug(f"Error extracting name: {e}")
-    
     # Validate name
-    if not business["name"] or business["name"].lower() in {"results", "overview", "about", "reviews", "n/a"}:
+    if not is_valid_business_name(business["name"]):
         return None
     
-    # Extract contact info from buttons
-    try:
-        buttons = page.query_selector_all("button[data-item-id]")
-        for btn in buttons:
+    return business
+
+def is_valid_business_name(name: str) -> bool:
+    """Reject empty names and Maps section headings picked up by mistake"""
+    return bool(name) and name.lower() not in INVALID_BUSINESS_NAMES
+
+def card_to_business(card: Dict) -> Dict:
+    """Build a business record from a result card extracted by EXTRACT_CARDS_JS"""
+    return {
+        "name": card.get("name") or "N/A",
+        "address": card.get("address") or "N/A",
+        "phone": card.get("phone") or "N/A",
+        "website": card.get("website") or "N/A",
+        "emails": set()
+    }
+
+class AsyncRateLimiter:
+    """Shared pacing for concurrent requests: at most `qps` starts per second, with jitter"""
+    
+    def __init__(self, qps: float):
+        self._interval = 1 / qps
+        self._next = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for the next free request slot"""
+        async with self._lock:
+            now = time.monotonic()
+            wait = max(0, self._next - now)
+            self._next = max(now, self._next) + self._interval
+            if wait:
+                await asyncio.sleep(wait + random.uniform(0, RATE_LIMIT_JITTER))
+
+class PagePool:
+    """Up to `size` browser pages, opened on first use and reused across businesses"""
+    
+    def __init__(self, context, size: int):
+        self.context = context
+        self._pages = []
+        # Holds idle pages, or None for a slot whose page isn't open yet
+        self._queue = asyncio.Queue()
+        for _ in range(size):
+            self._queue.put_nowait(None)
+    
+    async def _open_page(self):
+        page = await self.context.new_page()
+        try:
+            await block_heavy_resources(page)
+        except Exception:
+            await page.close()
+            raise
+        self._pages.append(page)
+        return page
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a page; it is reset to about:blank when returned"""
+        page = await self._queue.get()
+        if page is None:
             try:
-                aria = btn.get_attribute("aria-label")
-                if not aria:
-                    continue
-                
-                aria_lower = aria.lower()
-                
-                if "address:" in aria_lower or "located at" in aria_lower:
-                    business["address"] = aria.split(":", 1)[-1].strip()
-                elif "phone:" in aria_lower or "call" in aria_lower:
-                    phone_match = re.search(r'[\d\s\-\(\)\+]+', aria)
-                    if phone_match:
-                        business["phone"] = phone_match.group().strip()
-                elif "website:" in aria_lower or aria.startswith("http"):
-                    website_match = re.search(r'https?://[^\s]+', aria)
-                    if website_match:
-                        business["website"] = website_match.group().strip()
-                    elif ":" in aria:
-                        business["website"] = aria.split(":", 1)[-1].strip()
+                page = await self._open_page()
+            except Exception:
+                # Give the slot back so waiters are never stranded
+                self._queue.put_nowait(None)
+                raise
+        try:
+            yield page
+        finally:
+            try:
+                await page.goto("about:blank")
             except Exception as e:
-                logger.debug(f"Error processing button: {e}")
-                continue
-    except Exception as e:
-        logger.debug(f"Error extracting contact info: {e}")
+                # Drop pages that crashed or got stuck; the slot reopens lazily
+                logger.debug("Dropping broken pooled page: %s", e)
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+                self._pages.remove(page)
+                page = None
+            self._queue.put_nowait(page)
+    
+    async def close(self):
+        """Close every page in the pool"""
+        for page in self._pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._pages.clear()
+
+async def fetch_business_details(pool: PagePool, limiter: AsyncRateLimiter, href: str) -> Optional[Dict]:
+    """Open a business detail page in a pooled tab and extract its data"""
+    async with pool.acquire() as detail_page:
+        try:
+            await limiter.acquire()
+            
+            # Navigate to business detail page
+            await detail_page.goto(href, timeout=BUSINESS_LOAD_TIMEOUT)
+            
+            # Wait for details to load
+            if not await wait_for_selector(detail_page, BUSINESS_NAME_SELECTORS, BUSINESS_LOAD_TIMEOUT):
+                logger.warning(f"Details didn't load: {href[:80]}")
+                return None
+            
+            await asyncio.sleep(1.5)
+            return await extract_business_data(detail_page)
+        except Exception as e:
+            logger.debug("Detail page failed for %.80s: %s", href, e)
+            return None
+
+def is_js_shell(html: bytes) -> bool:
+    """Check if HTML is a near-empty shell that only renders with JavaScript"""
+    return len(html) < JS_SHELL_MAX_BYTES and b'<script' in html.lower()
+
+async def extract_emails_from_website(pool: PagePool, website: str, business_name: str) -> Set[str]:
+    """Extract emails from a business website over plain HTTP"""
+    emails = set()
     
-    # Try alternative methods for contact info
     try:
-        # Phone number
-        if business["phone"] == "N/A":
-            phone_selectors = [
-                'button[data-item-id*="phone"]',
-                'button[aria-label*="Phone"]',
-                'div[data-tooltip*="phone" i]'
-            ]
-            for selector in phone_selectors:
-                el = page.query_selector(selector)
-                if el:
-                    text = el.get_attribute("aria-label") or el.inner_text()
-                    phone_match = re.search(r'[\d\s\-\(\)\+]{10,}', text)
-                    if phone_match:
-                        business["phone"] = phone_match.group().strip()
-                        break
+        logger.debug("Extracting emails from: %s", website)
         
-        # Website
-        if business["website"] == "N/A":
-            website_selectors = [
-                'a[data-item-id*="authority"]',
-                'button[data-item-id*="authority"]',
-                'a[aria-label*="Website"]'
-            ]
-            for selector in website_selectors:
-                el = page.query_selector(selector)
-                if el:
-                    href = el.get_attribute("href")
-                    aria = el.get_attribute("aria-label")
-                    
-                    if href and href.startswith("http"):
-                        business["website"] = href
-                        break
-                    elif aria:
-                        website_match = re.search(r'https?://[^\s]+', aria)
-                        if website_match:
-                            business["website"] = website_match.group()
-                            break
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=WEBSITE_LOAD_TIMEOUT / 1000,
+            follow_redirects=True,
+            headers={'User-Agent': USER_AGENT}
+        ) as client:
+            response = await client.get(website)
+            content = response.content
+            
+            # JavaScript-rendered sites need the real browser
+            if is_js_shell(content):
+                logger.debug("JS shell detected, falling back to browser: %s", website)
+                return await extract_emails_with_browser(pool, website, business_name)
+            
+            # Extract emails from HTML
+            found_emails = extract_emails_from_text(content)
+            
+            # Try to find contact page
+            contact_links = HTMLParser(content).css(CONTACT_LINK_SELECTOR)
+            
+            for link in contact_links[:2]:  # Only check first 2 contact links
+                try:
+                    href = link.attributes.get("href")
+                    if href and not href.startswith("javascript:") and not href.startswith("mailto:"):
+                        href = urljoin(str(response.url), href)
+                        
+                        async with client.stream('GET', href, timeout=10) as contact_response:
+                            found_emails.update(await extract_emails_from_stream(contact_response))
+                except Exception as e:
+                    logger.debug("Error checking contact page: %s", e)
+                    continue
+            
+            emails = found_emails
         
-        # Address
-        if business["address"] == "N/A":
-            address_selectors = [
-                'button[data-item-id*="address"]',
-                'button[aria-label*="Address"]'
-            ]
-            for selector in address_selectors:
-                el = page.query_selector(selector)
-                if el:
-                    aria = el.get_attribute("aria-label")
-                    if aria and "address:" in aria.lower():
-                        business["address"] = aria.split(":", 1)[-1].strip()
-                        break
-                    
     except Exception as e:
-        logger.debug(f"Error in alternative extraction: {e}")
+        logger.debug("Email extraction failed for %s: %s", business_name, e)
     
-    return business
+    return emails
 
-def extract_emails_from_website(page, website: str, business_name: str) -> Set[str]:
-    """Extract emails from a business website"""
+async def extract_emails_with_browser(pool: PagePool, website: str, business_name: str) -> Set[str]:
+    """Extract emails from a JavaScript-rendered website using Playwright"""
     emails = set()
     
     try:
-        logger.debug(f"Extracting emails from: {website}")
-        
-        # Create new context for email extraction to avoid navigation issues
-        new_page = page.context.new_page()
+        logger.debug("Extracting emails with browser from: %s", website)
         
-        try:
-            new_page.goto(website, timeout=WEBSITE_LOAD_TIMEOUT, wait_until='domcontentloaded')
-            time.sleep(2)
+        # Borrow a pooled tab so the Maps page is never navigated away
+        async with pool.acquire() as new_page:
+            await new_page.goto(website, timeout=WEBSITE_LOAD_TIMEOUT, wait_until='domcontentloaded')
+            await asyncio.sleep(2)
             
             # Get page content
-            content = new_page.content()
+            content = await new_page.content()
             
             # Extract emails from HTML
             found_emails = extract_emails_from_text(content)
             
-            # Try to find contact page
-            contact_links = new_page.query_selector_all('a[href*="contact"], a[href*="about"]')
+            # Try to find contact page; read hrefs up front since handles die on navigation
+            base_url = new_page.url
+            contact_hrefs = await new_page.eval_on_selector_all(
+                CONTACT_LINK_SELECTOR,
+                "(links) => links.map((a) => a.getAttribute('href'))"
+            )
             
-            for link in contact_links[:2]:  # Only check first 2 contact links
+            for href in contact_hrefs[:2]:  # Only check first 2 contact links
                 try:
-                    href = link.get_attribute("href")
                     if href and not href.startswith("javascript:") and not href.startswith("mailto:"):
-                        if not href.startswith("http"):
-                            href = website.rstrip('/') + '/' + href.lstrip('/')
+                        # Go straight to the next link; the landing page is never reread
+                        await new_page.goto(urljoin(base_url, href), timeout=10000, wait_until='domcontentloaded')
+                        await asyncio.sleep(1)
                         
-                        new_page.goto(href, timeout=10000, wait_until='domcontentloaded')
-                        time.sleep(1)
-                        
-                        contact_content = new_page.content()
+                        contact_content = await new_page.content()
                         found_emails.update(extract_emails_from_text(contact_content))
-                        
-                        new_page.go_back(timeout=5000)
-                        time.sleep(1)
                 except Exception as e:
-                    logger.debug(f"Error checking contact page: {e}")
+                    logger.debug("Error checking contact page: %s", e)
                     continue
             
             emails = found_emails
-            
-        finally:
-            new_page.close()
         
     except Exception as e:
-        logger.debug(f"Email extraction failed for {business_name}: {e}")
+        logger.debug("Email extraction failed for %s: %s", business_name, e)
     
     return emails
 
@@ -442,7 +848,7 @@ def extract_emails_from_website(page, website: str, business_name: str) -> Set[s
 # MAIN SCRAPER
 # ============================================
 
-def main():
+async def main():
     # CLI Arguments
     parser = argparse.ArgumentParser(description="Google Maps Business Scraper (Fixed)")
     parser.add_argument("--keyword", required=True, help="Business keyword")
@@ -451,7 +857,9 @@ def main():
     parser.add_argument("--max-results", type=int, default=None, help="Maximum businesses to scrape")
     parser.add_argument("--no-emails", action="store_true", help="Skip email extraction")
     parser.add_argument("--timeout", type=int, default=600, help="Total timeout in seconds")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Businesses processed in parallel")
     parser.add_argument("--resume", action="store_true", help="Resume from last checkpoint")
+    parser.add_argument("--profile-dir", default=BROWSER_PROFILE_DIR, help="Chromium profile/cache directory (locked while in use; give parallel runs their own)")
     parser.add_argument("--verbose", action="store_true", help="Verbose logging")
     
     args = parser.parse_args()
@@ -465,183 +873,195 @@ def main():
     MAX_RESULTS = args.max_results
     SKIP_EMAILS = args.no_emails
     TIMEOUT = args.timeout
+    CONCURRENCY = max(1, args.concurrency)
     RESUME = args.resume
+    PROFILE_DIR = args.profile_dir
     
     query = f"{KEYWORD} in {CITY}"
-    checkpoint_file = os.path.join(CHECKPOINT_DIR, f"{safe_filename(KEYWORD)}_{safe_filename(CITY)}.json")
+    checkpoint_file = os.path.join(CHECKPOINT_DIR, f"{safe_filename(KEYWORD)}_{safe_filename(CITY)}.jsonl")
     
     logger.info(f"Starting scraper for: {query}")
-    logger.info(f"Config: headless={HEADLESS}, max_results={MAX_RESULTS}, skip_emails={SKIP_EMAILS}")
+    logger.info(f"Config: headless={HEADLESS}, max_results={MAX_RESULTS}, skip_emails={SKIP_EMAILS}, concurrency={CONCURRENCY}")
     
     start_time = time.time()
     businesses = []
-    start_index = 0
+    seen = {}  # dedup key -> business, kept live while scraping
+    duplicate_count = 0
+    done_indices = set()
     
     # Check for checkpoint
     if RESUME:
         checkpoint = load_checkpoint(checkpoint_file)
         if checkpoint:
-            businesses = checkpoint["businesses"]
-            start_index = checkpoint["index"]
+            businesses = deduplicate_businesses(checkpoint["businesses"])
+            seen = {business_key(b): b for b in businesses}
+            done_indices = checkpoint["done"]
+    elif os.path.exists(checkpoint_file):
+        # Fresh run: don't append to a stale checkpoint
+        os.remove(checkpoint_file)
     
-    browser = None
+    context = None
     try:
-        with sync_playwright() as p:
-            logger.info(f"Browser launch params: headless={HEADLESS}")
-            browser = p.chromium.launch(
+        async with async_playwright() as p:
+            logger.info(f"Browser launch params: headless={HEADLESS}, profile={PROFILE_DIR}")
+            # Persistent profile keeps the HTTP cache (Maps JS/CSS) warm between runs
+            context = await p.chromium.launch_persistent_context(
+                user_data_dir=PROFILE_DIR,
                 headless=HEADLESS,
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=USER_AGENT,
                 args=[
                     "--disable-dev-shm-usage",
-                    "--disable-blink-features=AutomationControlled"
+                    "--disable-blink-features=AutomationControlled",
+                    "--blink-settings=imagesEnabled=false",
+                    f"--disk-cache-size={BROWSER_DISK_CACHE_SIZE}"
                 ]
             )
             
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-            
-            page = context.new_page()
+            page = context.pages[0] if context.pages else await context.new_page()
+            await block_heavy_resources(page)
             
             try:
                 # Navigate to Google Maps
                 logger.info("Loading Google Maps...")
-                page.goto("https://www.google.com/maps", timeout=SEARCH_TIMEOUT, wait_until='domcontentloaded')
+                await page.goto("https://www.google.com/maps", timeout=SEARCH_TIMEOUT, wait_until='domcontentloaded')
                 
                 # Wait for search box to appear (more reliable than networkidle)
                 logger.info("Waiting for search box...")
-                if not wait_for_selector(page, SEARCH_BOX_SELECTORS, 30000):
+                if not await wait_for_selector(page, SEARCH_BOX_SELECTORS, 30000):
                     raise RuntimeError("Search box did not appear")
                 
-                time.sleep(2)
+                await asyncio.sleep(2)
                 
                 # Search
                 logger.info(f"Searching for: {query}")
-                search_box = get_selector(page, SEARCH_BOX_SELECTORS)
+                search_box = await get_selector(page, SEARCH_BOX_SELECTORS)
                 if not search_box:
                     raise RuntimeError("Could not find search box")
                 
                 # Clear any existing text and search
-                search_box.click()
-                time.sleep(0.5)
-                page.keyboard.press("Control+A")
-                time.sleep(0.2)
-                search_box.fill(query)
-                time.sleep(1.5)
-                page.keyboard.press("Enter")
+                await search_box.click()
+                await asyncio.sleep(0.5)
+                await page.keyboard.press("Control+A")
+                await asyncio.sleep(0.2)
+                await search_box.fill(query)
+                await asyncio.sleep(1.5)
+                await page.keyboard.press("Enter")
                 
                 # Wait for results panel
                 logger.info("Waiting for results...")
-                time.sleep(3)  # Give it time to start loading
+                await asyncio.sleep(3)  # Give it time to start loading
                 
-                if not wait_for_selector(page, RESULTS_PANEL_SELECTORS, 20000):
+                if not await wait_for_selector(page, RESULTS_PANEL_SELECTORS, 20000):
                     # Try alternative: wait for business cards directly
                     logger.info("Results panel not found, checking for business cards...")
-                    if not wait_for_selector(page, [BUSINESS_CARD_SELECTOR], 10000):
+                    if not await wait_for_selector(page, (BUSINESS_CARD_SELECTOR,), 10000):
                         raise RuntimeError("No results found")
                 
-                results_panel = get_selector(page, RESULTS_PANEL_SELECTORS)
+                results_panel = await get_selector(page, RESULTS_PANEL_SELECTORS)
                 if not results_panel:
                     logger.warning("Results panel not found, trying to proceed anyway...")
                     # Find results panel by looking for parent of business cards
-                    first_card = page.query_selector(BUSINESS_CARD_SELECTOR)
+                    first_card = await page.query_selector(BUSINESS_CARD_SELECTOR)
                     if first_card:
-                        results_panel = page.evaluate(
+                        results_panel = await page.evaluate_handle(
                             '(card) => card.closest(\'div[role="feed"]\') || card.closest(\'div[role="list"]\')',
                             first_card
                         )
                 
-                time.sleep(2)
+                await asyncio.sleep(2)
                 
                 # Scroll to load all results
                 logger.info("Scrolling results panel...")
-                scroll_count = scroll_results_panel(page, results_panel, TIMEOUT, start_time)
+                scroll_count = await scroll_results_panel(page, results_panel, TIMEOUT, start_time)
                 logger.info(f"[OK] Scrolling complete ({scroll_count} scrolls)")
                 
                 # Wait a bit for all cards to render
-                time.sleep(2)
-                
-                # Collect all business links (hrefs) instead of elements
-                all_cards = page.query_selector_all(BUSINESS_CARD_SELECTOR)
-                business_hrefs = []
+                await asyncio.sleep(2)
                 
-                for card in all_cards:
-                    try:
-                        href = card.get_attribute("href")
-                        if href:
-                            business_hrefs.append(href)
-                    except:
-                        continue
+                # Read every business straight from the loaded result cards
+                cards = await page.evaluate(EXTRACT_CARDS_JS, BUSINESS_CARD_SELECTOR)
                 
-                total_businesses = len(business_hrefs)
+                total_businesses = len(cards)
                 logger.info(f"[FOUND] Total businesses found: {total_businesses}")
                 
                 if MAX_RESULTS:
-                    business_hrefs = business_hrefs[:MAX_RESULTS]
-                    total_businesses = len(business_hrefs)
+                    cards = cards[:MAX_RESULTS]
+                    total_businesses = len(cards)
                 
-                # Process businesses by navigating to their URLs
-                for index, href in enumerate(business_hrefs):
-                    if time.time() - start_time > TIMEOUT:
-                        logger.warning("Global timeout reached, saving progress...")
-                        break
-                    
-                    if start_index > 0 and index < start_index:
-                        continue
+                semaphore = asyncio.Semaphore(CONCURRENCY)
+                pool = PagePool(context, CONCURRENCY)
+                limiter = AsyncRateLimiter(MAX_BUSINESS_QPS)
+                timed_out = False
+                
+                async def process_one(index: int, card: Dict):
+                    """Build one business from its card, visiting the detail page only if needed"""
+                    nonlocal duplicate_count, timed_out
                     
-                    try:
-                        logger.info(f"\nProcessing {index + 1}/{total_businesses}...")
-                        time.sleep(DELAY_BETWEEN_BUSINESS)
-                        
-                        # Navigate to business detail page
-                        page.goto(href, timeout=BUSINESS_LOAD_TIMEOUT)
+                    async with semaphore:
+                        if timed_out:
+                            return
+                        if time.time() - start_time > TIMEOUT:
+                            timed_out = True
+                            logger.warning(f"Global timeout reached at business {index + 1}, skipping the rest...")
+                            return
                         
-                        # Wait for details to load
-                        if not wait_for_selector(page, BUSINESS_NAME_SELECTORS, BUSINESS_LOAD_TIMEOUT):
-                            logger.warning(f"Skipping business {index + 1}: details didn't load")
-                            continue
+                        try:
+                            logger.info(f"\nProcessing {index + 1}/{total_businesses}...")
+                            business = card_to_business(card)
+                            
+                            # No website on the card; the detail view may list one for email lookup
+                            if not SKIP_EMAILS and business["website"] == "N/A" and card.get("href"):
+                                details = await fetch_business_details(pool, limiter, card["href"])
+                                if details:
+                                    for key in ("name", "address", "phone", "website"):
+                                        if business[key] == "N/A":
+                                            business[key] = details[key]
+                            
+                            if not is_valid_business_name(business["name"]):
+                                logger.warning(f"Skipping invalid business at index {index + 1}")
+                                return
+                            
+                            # Extract emails if needed
+                            emails = set()
+                            if not SKIP_EMAILS and business["website"] != "N/A":
+                                if not should_skip_email_extraction(business["website"]):
+                                    emails = await extract_emails_from_website(pool, business["website"], business["name"])
+                                    await asyncio.sleep(DELAY_AFTER_EMAIL_EXTRACTION)
+                            
+                            business["emails"] = emails
+                            append_checkpoint(checkpoint_file, business, index)
+                            
+                            # Deduplicate on insertion: merge emails into the first copy
+                            key = business_key(business)
+                            if key in seen:
+                                seen[key]["emails"] |= business["emails"]
+                                duplicate_count += 1
+                                logger.info(f"[DUP] {index + 1}. {business['name']} (merged)")
+                                return
+                            seen[key] = business
+                            businesses.append(business)
+                            logger.info(f"[OK] {index + 1}. {business['name']}")
+                            logger.info(f"   Phone: {business['phone']}, Website: {business['website'][:50] if business['website'] != 'N/A' else 'N/A'}")
                         
-                        time.sleep(1.5)
-                        
-                        # Extract business data
-                        business = extract_business_data(page)
-                        
-                        if not business:
-                            logger.warning(f"Skipping invalid business at index {index + 1}")
-                            continue
-                        
-                        # Extract emails if needed
-                        emails = set()
-                        if not SKIP_EMAILS and business["website"] != "N/A":
-                            if not should_skip_email_extraction(business["website"]):
-                                emails = extract_emails_from_website(page, business["website"], business["name"])
-                                time.sleep(DELAY_AFTER_EMAIL_EXTRACTION)
-                        
-                        business["emails"] = ", ".join(sorted(emails)) if emails else "N/A"
-                        
-                        businesses.append(business)
-                        logger.info(f"[OK] {index + 1}. {business['name']}")
-                        logger.info(f"   Phone: {business['phone']}, Website: {business['website'][:50] if business['website'] != 'N/A' else 'N/A'}")
-                        
-                        # Save checkpoint every 10 businesses
-                        if (index + 1) % 10 == 0:
-                            save_checkpoint(checkpoint_file, businesses, index + 1)
-                    
-                    except Exception as e:
-                        logger.error(f"❌ Failed at business {index + 1}: {e}")
-                        continue
+                        except Exception as e:
+                            logger.error(f"❌ Failed at business {index + 1}: {e}")
+                
+                # Process businesses concurrently
+                await asyncio.gather(*(
+                    process_one(index, card)
+                    for index, card in enumerate(cards)
+                    if index not in done_indices
+                ))
+                await pool.close()
                 
                 logger.info(f"\nProcessing complete. Total collected: {len(businesses)}")
             
             finally:
-                if browser:
-                    browser.close()
+                if context:
+                    await context.close()
         
-        # Deduplication
-        logger.info("Deduplicating businesses...")
-        original_count = len(businesses)
-        businesses = deduplicate_businesses(businesses)
-        logger.info(f"[CLEANUP] Removed {original_count - len(businesses)} duplicates. Final count: {len(businesses)}")
+        logger.info(f"[CLEANUP] Merged {duplicate_count} duplicates. Final count: {len(businesses)}")
         
         # Display sample
         if businesses:
@@ -651,32 +1071,33 @@ def main():
                 logger.info(f"    Address: {b['address']}")
                 logger.info(f"    Phone: {b['phone']}")
                 logger.info(f"    Website: {b['website']}")
-                logger.info(f"    Emails: {b['emails']}")
+                logger.info(f"    Emails: {format_emails(b['emails'])}")
         
         # Save CSV
         if businesses:
             csv_file = os.path.join(OUTPUT_DIR, f"{safe_filename(KEYWORD)}_{safe_filename(CITY)}_businesses.csv")
             with open(csv_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=["name", "address", "phone", "website", "emails"]
+                writer = csv.writer(f)
+                writer.writerow(OUTPUT_FIELDS)
+                writer.writerows(
+                    (b["name"], b["address"], b["phone"], b["website"], format_emails(b["emails"]))
+                    for b in businesses
                 )
-                writer.writeheader()
-                writer.writerows(businesses)
             
             logger.info(f"\n[SAVED] CSV saved -> {csv_file}")
             
             # Save JSON
             json_file = os.path.join(OUTPUT_DIR, f"{safe_filename(KEYWORD)}_{safe_filename(CITY)}_businesses.json")
-            with open(json_file, "w", encoding="utf-8") as f:
-                json.dump(businesses, f, indent=2, ensure_ascii=False)
+            rows = [{**b, "emails": format_emails(b["emails"])} for b in businesses]
+            with open(json_file, "wb") as f:
+                f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2))
             
             logger.info(f"[SAVED] JSON saved -> {json_file}")
             
             # Statistics summary
             with_phone = sum(1 for b in businesses if b["phone"] != "N/A")
             with_website = sum(1 for b in businesses if b["website"] != "N/A")
-            with_email = sum(1 for b in businesses if b["emails"] != "N/A")
+            with_email = sum(1 for b in businesses if b["emails"])
             
             logger.info("\n" + "="*50)
             logger.info("[SUMMARY] FINAL SUMMARY")
@@ -698,16 +1119,20 @@ def main():
         logger.info(f"\n[TIME] Total time: {elapsed:.1f}s")
         logger.info(f"[LOG] Log file: {log_file}")
     
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("\n[WARNING] Scraper interrupted by user")
         if businesses:
-            save_checkpoint(checkpoint_file, businesses, len(businesses))
-            logger.info("Progress saved to checkpoint")
+            logger.info(f"Progress saved to checkpoint: {checkpoint_file}")
+        raise
     except Exception as e:
         logger.exception(f"Fatal error: {e}")
         if businesses:
-            save_checkpoint(checkpoint_file, businesses, len(businesses))
+            logger.info(f"Progress saved to checkpoint: {checkpoint_file}")
         raise
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Ctrl-C: main() already logged where progress was saved
+        sys.exit(130)
\ No newline at end of file
@@ -10,13 +10,19 @@ import subprocess
 def test_dependencies():
     """Check if all required packages are installed"""
     print("✅ Testing dependencies...")
-    required = ['flask', 'playwright']
+    required = ['flask', 'playwright', 'httpx', 'selectolax', 'orjson']
     
     try:
         import flask
         import playwright
+        import httpx
+        import selectolax
+        import orjson
         print("   ✓ Flask installed")
         print("   ✓ Playwright installed")
+        print("   ✓ httpx installed")
+        print("   ✓ selectolax installed")
+        print("   ✓ orjson installed")
         return True
     except ImportError as e:
         print(f"   ✗ Missing: {e}")